@@ -1,17 +1,26 @@
+import os
 import boto3
-from moto import mock_s3
+from moto import mock_aws
 import pytest
 
-@mock_s3
-def test_create_bucket():
-    # Mock S3 environment
-    s3 = boto3.client('s3', region_name='us-east-1')
-    
+# Static fake credentials so boto3 skips the credential provider chain
+os.environ.setdefault('AWS_ACCESS_KEY_ID', 'test')
+os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'test')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+@pytest.fixture(scope='module')
+def s3():
+    # Mock S3 environment, shared by every test in this module
+    with mock_aws():
+        yield boto3.client('s3', region_name='us-east-1')
+
+@pytest.mark.parametrize('bucket_name', ['my-test-bucket', 'my-other-test-bucket'])
+def test_create_bucket(s3, bucket_name):
     # Create a bucket using Moto
-    s3.create_bucket(Bucket='my-test-bucket')
-    
+    s3.create_bucket(Bucket=bucket_name)
+
     # List buckets to verify
     response = s3.list_buckets()
     bucket_names = [bucket['Name'] for bucket in response['Buckets']]
-    
-    assert 'my-test-bucket' in bucket_names
+
+    assert bucket_name in bucket_names
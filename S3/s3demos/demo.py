@@ -7,13 +7,22 @@ Run this with the Moto server running:
 3. Run this script: python demo.py
 """
 
+import asyncio
 import os
 import sys
+
+from botocore.config import Config
+from s3sim.async_operations import upload_files
 from s3sim.s3_operations import (
-    create_bucket, list_buckets, upload_file, read_file, 
+    get_s3_client, create_bucket, list_buckets, read_file, 
     update_file, list_files, delete_file, delete_bucket
 )
 
+# One shared client for every operation, including the concurrent uploads
+# (clients are thread-safe, resources are not). The larger pool avoids
+# "Connection pool is full" warnings.
+client = get_s3_client(config=Config(max_pool_connections=64))
+
 def main():
     """Run the S3Sim demo."""
     # Check if the endpoint URL is set
@@ -29,55 +38,58 @@ def main():
     # Create a test bucket
     bucket_name = 'demo-bucket'
     print(f"\nCreating bucket: {bucket_name}")
-    create_bucket(bucket_name)
+    create_bucket(bucket_name, client=client)
     
     # List buckets
-    buckets = list_buckets()
+    buckets = list_buckets(client=client)
     print(f"Available buckets: {buckets}")
     
     # Upload some files
     print("\nUploading files...")
-    upload_file(bucket_name, 'hello.txt', 'Hello, S3!')
-    upload_file(bucket_name, 'data.json', '{"name": "test", "value": 42}')
-    upload_file(bucket_name, 'folder/nested.txt', 'Nested file content')
+    items = [
+        ('hello.txt', 'Hello, S3!'),
+        ('data.json', '{"name": "test", "value": 42}'),
+        ('folder/nested.txt', 'Nested file content'),
+    ]
+    asyncio.run(upload_files(bucket_name, items, client=client))
     
     # List files
     print("\nAll files in bucket:")
-    files = list_files(bucket_name)
+    files = list_files(bucket_name, client=client)
     for file in files:
         print(f" - {file}")
     
     # Read a file
     file_key = 'hello.txt'
     print(f"\nReading {file_key}:")
-    content = read_file(bucket_name, file_key)
+    content = read_file(bucket_name, file_key, client=client)
     print(f"Content: {content}")
     
     # Update a file
     print(f"\nUpdating {file_key}")
-    update_file(bucket_name, file_key, 'Updated content!')
-    content = read_file(bucket_name, file_key)
+    update_file(bucket_name, file_key, 'Updated content!', client=client)
+    content = read_file(bucket_name, file_key, client=client)
     print(f"New content: {content}")
     
     # List files in subfolder
     print("\nFiles in 'folder/':")
-    folder_files = list_files(bucket_name, prefix='folder/')
+    folder_files = list_files(bucket_name, prefix='folder/', client=client)
     for file in folder_files:
         print(f" - {file}")
     
     # Delete a file
     print(f"\nDeleting {file_key}")
-    delete_file(bucket_name, file_key)
+    delete_file(bucket_name, file_key, client=client)
     
     # List remaining files
     print("\nRemaining files:")
-    remaining_files = list_files(bucket_name)
+    remaining_files = list_files(bucket_name, client=client)
     for file in remaining_files:
         print(f" - {file}")
     
     # Clean up
     print(f"\nDeleting bucket {bucket_name} with force=True")
-    delete_bucket(bucket_name, force=True)
+    delete_bucket(bucket_name, force=True, client=client)
     
     print("\nDemo completed successfully!")
 
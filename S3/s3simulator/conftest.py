@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures for the S3Sim tests.
+"""
+
+import pytest
+from moto import mock_aws
+
+from s3sim.tests import LARGE_FILE_SIZE
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    """Mock AWS credentials for moto."""
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    monkeypatch.setenv('AWS_SECURITY_TOKEN', 'testing')
+    monkeypatch.setenv('AWS_SESSION_TOKEN', 'testing')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+
+@pytest.fixture
+def s3_mock(aws_credentials, monkeypatch):
+    """Run against Moto's in-memory S3 backend."""
+    monkeypatch.delenv('S3_ENDPOINT_URL', raising=False)
+    with mock_aws():
+        yield
+
+@pytest.fixture(scope='session')
+def large_file(tmp_path_factory):
+    """Sparse large file allocated once and shared by the multipart tests."""
+    path = tmp_path_factory.mktemp('s3') / 'big.bin'
+    with open(path, 'wb') as f:
+        f.truncate(LARGE_FILE_SIZE)
+    return str(path)
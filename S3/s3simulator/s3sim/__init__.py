@@ -15,6 +15,7 @@ from s3sim.s3_operations import (
     update_file,
     delete_file,
     list_files,
+    list_files_prefetched,
     delete_bucket,
 )
 
@@ -0,0 +1,197 @@
+"""
+Asyncio variants of the S3 operations for concurrent fan-outs.
+
+Uses aioboto3 when it is installed. Otherwise, or when the caller passes
+an existing synchronous client, each request runs the boto3 operation in
+the event loop's default thread pool, so callers can still gather many
+requests at once.
+"""
+
+import asyncio
+import logging
+import os
+from functools import partial
+from botocore.exceptions import ClientError
+
+from s3sim import s3_operations
+
+try:
+    import aioboto3
+except ImportError:  # Optional dependency: pip install s3sim[async]
+    aioboto3 = None
+
+logger = logging.getLogger(__name__)
+
+def _client_kwargs():
+    """Mirror get_s3_client's endpoint and SSL handling for aioboto3."""
+    endpoint_url = os.environ.get('S3_ENDPOINT_URL', None)
+    verify = not (endpoint_url and 'localhost' in endpoint_url)
+    return {'endpoint_url': endpoint_url, 'verify': verify}
+
+async def _gather_in_threads(calls):
+    """Run blocking calls in the default executor and gather the results."""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(loop.run_in_executor(None, call) for call in calls))
+
+async def _upload(s3_client, bucket_name, key, content):
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    try:
+        await s3_client.put_object(Bucket=bucket_name, Key=key, Body=content)
+        logger.info(f"File '{key}' uploaded to bucket '{bucket_name}'")
+        return True
+
+    except ClientError as e:
+        logger.error(f"Error uploading file '{key}' to bucket '{bucket_name}': {e}")
+        return False
+
+async def _read(s3_client, bucket_name, key):
+    try:
+        response = await s3_client.get_object(Bucket=bucket_name, Key=key)
+        async with response['Body'] as body:
+            return (await body.read()).decode('utf-8')
+
+    except ClientError as e:
+        logger.error(f"Error reading file '{key}' from bucket '{bucket_name}': {e}")
+        raise Exception(f"File read error: {e}")
+
+async def upload_files(bucket_name, items, client=None):
+    """
+    Upload several objects concurrently.
+
+    Args:
+        bucket_name (str): Target bucket name
+        items (iterable): (key, content) pairs to upload
+        client (boto3.client, optional): Synchronous S3 client to reuse; when
+            given, requests run on it in the thread pool instead of aioboto3
+
+    Returns:
+        list: One bool per item, True if that upload succeeded
+    """
+    if aioboto3 is None or client is not None:
+        s3_client = client or s3_operations.get_s3_client()
+        return await _gather_in_threads(
+            partial(s3_operations.upload_file, bucket_name, key, content, client=s3_client)
+            for key, content in items
+        )
+
+    async with aioboto3.Session().client('s3', **_client_kwargs()) as s3_client:
+        return await asyncio.gather(
+            *(_upload(s3_client, bucket_name, key, content) for key, content in items)
+        )
+
+async def read_files(bucket_name, keys, client=None):
+    """
+    Read several objects concurrently.
+
+    Args:
+        bucket_name (str): Source bucket name
+        keys (iterable): Object keys to read
+        client (boto3.client, optional): Synchronous S3 client to reuse; when
+            given, requests run on it in the thread pool instead of aioboto3
+
+    Returns:
+        dict: Object content (UTF-8 decoded) keyed by object key
+    """
+    keys = list(keys)
+
+    if aioboto3 is None or client is not None:
+        s3_client = client or s3_operations.get_s3_client()
+        contents = await _gather_in_threads(
+            partial(s3_operations.read_file, bucket_name, key, client=s3_client)
+            for key in keys
+        )
+    else:
+        async with aioboto3.Session().client('s3', **_client_kwargs()) as s3_client:
+            contents = await asyncio.gather(
+                *(_read(s3_client, bucket_name, key) for key in keys)
+            )
+
+    return dict(zip(keys, contents))
+
+async def _list_keys(s3_client, bucket_name, prefix):
+    paginator = s3_client.get_paginator('list_objects_v2')
+    async for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        for obj in page.get('Contents', []):
+            yield obj['Key']
+
+async def _iterate_in_thread(iterator):
+    """Drive a blocking iterator from the default executor, one item at a time."""
+    loop = asyncio.get_running_loop()
+    done = object()
+    try:
+        while True:
+            item = await loop.run_in_executor(None, next, iterator, done)
+            if item is done:
+                return
+            yield item
+    finally:
+        iterator.close()
+
+async def _read_bounded(keys, read, limit):
+    """Yield (key, content) as reads finish, with at most `limit` in flight."""
+    pending = set()
+
+    async def run(key):
+        return key, await read(key)
+
+    try:
+        async for key in keys:
+            if len(pending) >= limit:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.ensure_future(run(key)))
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def read_all_files(bucket_name, prefix='', client=None, max_concurrency=10):
+    """
+    List a bucket and fetch the listed objects concurrently.
+
+    At most `max_concurrency` objects are downloaded, and held in memory,
+    at once. Each one is yielded as soon as it has been read.
+
+    Args:
+        bucket_name (str): Source bucket name
+        prefix (str, optional): Key prefix to filter by
+        client (boto3.client, optional): Synchronous S3 client to reuse; when
+            given, requests run on it in the thread pool instead of aioboto3
+        max_concurrency (int, optional): Maximum number of reads in flight
+
+    Yields:
+        tuple: (key, content) pairs in completion order, content UTF-8 decoded
+
+    Raises:
+        ClientError: If the bucket cannot be listed
+    """
+    if aioboto3 is None or client is not None:
+        s3_client = client or s3_operations.get_s3_client()
+        loop = asyncio.get_running_loop()
+        # Stream keys page by page (raising ClientError like the aioboto3 path)
+        keys = _iterate_in_thread(
+            s3_operations.list_files_prefetched(bucket_name, prefix, client=s3_client)
+        )
+
+        def read(key):
+            return loop.run_in_executor(
+                None, partial(s3_operations.read_file, bucket_name, key, client=s3_client)
+            )
+
+        async for item in _read_bounded(keys, read, max_concurrency):
+            yield item
+        return
+
+    async with aioboto3.Session().client('s3', **_client_kwargs()) as s3_client:
+        keys = _list_keys(s3_client, bucket_name, prefix)
+        read = partial(_read, s3_client, bucket_name)
+        async for item in _read_bounded(keys, read, max_concurrency):
+            yield item
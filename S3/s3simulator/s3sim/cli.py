@@ -5,7 +5,9 @@ import argparse
 import os
 import sys
 import json
+from botocore.config import Config
 from s3sim.s3_operations import (
+    get_s3_client,
     create_bucket,
     delete_bucket,
     list_buckets,
@@ -16,8 +18,8 @@ from s3sim.s3_operations import (
     load_config_from_file
 )
 
-def main():
-    """Run the S3Sim CLI."""
+def _build_parser():
+    """Build the argument parser for the CLI."""
     parser = argparse.ArgumentParser(description='S3Sim - AWS S3 Simulator CLI')
     
     # Global options
@@ -58,6 +60,8 @@ def main():
     upload_large_parser.add_argument('file_path', help='Path to the file to upload')
     upload_large_parser.add_argument('--part-size', type=int, default=5*1024*1024,
                                     help='Size of each part in bytes (default: 5MB)')
+    upload_large_parser.add_argument('--concurrency', type=int, default=10,
+                                    help='Number of parts uploaded in parallel (default: 10)')
     upload_large_parser.add_argument('--metadata', help='Metadata as JSON string')
     
     # read command
@@ -75,8 +79,22 @@ def main():
     list_parser.add_argument('bucket_name', help='Bucket name')
     list_parser.add_argument('--prefix', default='', help='Key prefix to filter by')
     
+    return parser
+
+# Built once at import so repeated main() calls reuse it
+_PARSER = _build_parser()
+
+def main(argv=None):
+    """
+    Run the S3Sim CLI.
+    
+    Args:
+        argv (list, optional): Arguments to parse (defaults to sys.argv[1:])
+    """
+    parser = _PARSER
+    
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # If no command provided, show help
     if not args.command:
@@ -93,8 +111,18 @@ def main():
     
     # Execute requested command
     try:
+        # Build one client up front and share it across every operation;
+        # multipart uploads need two connections per concurrent part
+        pool_size = 32
+        if args.command == 'upload-large':
+            pool_size = max(pool_size, 2 * args.concurrency)
+        client = get_s3_client(
+            config=Config(max_pool_connections=pool_size, retries={'mode': 'adaptive'}),
+            profile_name=args.profile
+        )
+        
         if args.command == 'create-bucket':
-            success = create_bucket(args.bucket_name, args.region)
+            success = create_bucket(args.bucket_name, args.region, client=client)
             if success:
                 print(f"Bucket '{args.bucket_name}' created successfully")
             else:
@@ -102,7 +130,7 @@ def main():
                 sys.exit(1)
                 
         elif args.command == 'list-buckets':
-            buckets = list_buckets()
+            buckets = list_buckets(client=client)
             if buckets:
                 print("Buckets:")
                 for bucket in buckets:
@@ -111,7 +139,7 @@ def main():
                 print("No buckets found")
                 
         elif args.command == 'delete-bucket':
-            success = delete_bucket(args.bucket_name, args.force)
+            success = delete_bucket(args.bucket_name, args.force, client=client)
             if success:
                 print(f"Bucket '{args.bucket_name}' deleted successfully")
             else:
@@ -119,12 +147,6 @@ def main():
                 sys.exit(1)
                 
         elif args.command == 'upload':
-            # Handle content from file or command line
-            content = args.content
-            if args.file:
-                with open(args.content, 'r') as f:
-                    content = f.read()
-            
             # Process metadata if provided
             metadata = None
             if args.metadata:
@@ -134,7 +156,16 @@ def main():
                     print("Error: metadata must be valid JSON")
                     sys.exit(1)
             
-            success = upload_file(args.bucket_name, args.key, content, metadata=metadata)
+            # Handle content from file or command line
+            if args.file:
+                # Hand boto3 the open file so it streams the body; a 1MB
+                # buffer keeps small reads from turning into syscalls
+                with open(args.content, 'rb', buffering=1024 * 1024) as f:
+                    success = upload_file(args.bucket_name, args.key, f,
+                                          metadata=metadata, client=client)
+            else:
+                success = upload_file(args.bucket_name, args.key, args.content,
+                                      metadata=metadata, client=client)
             if success:
                 print(f"File '{args.key}' uploaded to bucket '{args.bucket_name}' successfully")
             else:
@@ -157,7 +188,9 @@ def main():
                 args.key, 
                 args.file_path, 
                 part_size=args.part_size,
-                metadata=metadata
+                metadata=metadata,
+                concurrency=args.concurrency,
+                client=client
             )
             if success:
                 print(f"Large file '{args.key}' uploaded to bucket '{args.bucket_name}' successfully")
@@ -167,14 +200,20 @@ def main():
                 
         elif args.command == 'read':
             try:
-                content = read_file(args.bucket_name, args.key)
-                print(content)
+                body = read_file(args.bucket_name, args.key, client=client, stream=True)
+                # Write chunks as they arrive rather than buffering the object
+                for chunk in body.iter_chunks(chunk_size=64 * 1024):
+                    sys.stdout.buffer.write(chunk)
+                # Output is byte-exact unless a terminal is showing it
+                if sys.stdout.isatty():
+                    sys.stdout.buffer.write(b'\n')
+                sys.stdout.buffer.flush()
             except Exception as e:
                 print(f"Error reading file: {e}")
                 sys.exit(1)
                 
         elif args.command == 'delete':
-            success = delete_file(args.bucket_name, args.key)
+            success = delete_file(args.bucket_name, args.key, client=client)
             if success:
                 print(f"File '{args.key}' deleted from bucket '{args.bucket_name}' successfully")
             else:
@@ -182,7 +221,7 @@ def main():
                 sys.exit(1)
                 
         elif args.command == 'list':
-            files = list_files(args.bucket_name, args.prefix)
+            files = list_files(args.bucket_name, args.prefix, client=client)
             if files:
                 print(f"Objects in bucket '{args.bucket_name}':")
                 for file in files:
@@ -0,0 +1,97 @@
+"""
+Asynchronous Command Line Interface for S3Sim.
+
+Covers the multi-object commands, whose requests are issued concurrently.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from s3sim.async_operations import upload_files, read_files, read_all_files
+
+async def _print_all_files(bucket_name, prefix, concurrency):
+    """Print each object as soon as it is read; return whether any were found."""
+    found = False
+    async for key, content in read_all_files(bucket_name, prefix, max_concurrency=concurrency):
+        found = True
+        print(f"--- {key} ---")
+        print(content)
+    return found
+
+def main():
+    """Run the S3Sim async CLI."""
+    parser = argparse.ArgumentParser(description='S3Sim - AWS S3 Simulator async CLI')
+
+    # Global options
+    parser.add_argument('--endpoint', help='S3 endpoint URL (overrides environment variable)')
+
+    # Command subparsers
+    subparsers = parser.add_subparsers(dest='command', help='S3 operations')
+
+    # upload command
+    upload_parser = subparsers.add_parser('upload', help='Upload several objects to S3')
+    upload_parser.add_argument('bucket_name', help='Target bucket name')
+    upload_parser.add_argument('items', nargs='+', metavar='KEY=CONTENT',
+                              help='Object key and content to upload')
+
+    # read command
+    read_parser = subparsers.add_parser('read', help='Read several files from S3')
+    read_parser.add_argument('bucket_name', help='Source bucket name')
+    read_parser.add_argument('keys', nargs='+', help='Object keys (paths) in bucket')
+
+    # read-all command
+    read_all_parser = subparsers.add_parser('read-all', help='Read every file in a bucket')
+    read_all_parser.add_argument('bucket_name', help='Bucket name')
+    read_all_parser.add_argument('--prefix', default='', help='Key prefix to filter by')
+    read_all_parser.add_argument('--concurrency', type=int, default=10,
+                                 help='Number of files read in parallel (default: 10)')
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # If no command provided, show help
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    # Override endpoint URL if provided
+    if args.endpoint:
+        os.environ['S3_ENDPOINT_URL'] = args.endpoint
+
+    # Execute requested command
+    try:
+        if args.command == 'upload':
+            items = []
+            for item in args.items:
+                key, sep, content = item.partition('=')
+                if not sep:
+                    print("Error: items must be given as KEY=CONTENT")
+                    sys.exit(1)
+                items.append((key, content))
+
+            results = asyncio.run(upload_files(args.bucket_name, items))
+            for (key, _), success in zip(items, results):
+                if success:
+                    print(f"File '{key}' uploaded to bucket '{args.bucket_name}' successfully")
+                else:
+                    print(f"Failed to upload file '{key}' to bucket '{args.bucket_name}'")
+            if not all(results):
+                sys.exit(1)
+
+        elif args.command == 'read':
+            contents = asyncio.run(read_files(args.bucket_name, args.keys))
+            for key, content in contents.items():
+                print(f"--- {key} ---")
+                print(content)
+
+        elif args.command == 'read-all':
+            found = asyncio.run(_print_all_files(args.bucket_name, args.prefix, args.concurrency))
+            if not found:
+                print(f"No objects found in bucket '{args.bucket_name}'")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
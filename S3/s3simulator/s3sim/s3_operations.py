@@ -2,45 +2,58 @@ import boto3
 import os
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def get_s3_client():
+def get_s3_client(config=None, profile_name=None):
     """
     Create and return an S3 client configured based on environment variables.
     Automatically handles SSL based on whether the local emulator is used or AWS is used.
     
+    Args:
+        config (botocore.config.Config, optional): Client configuration,
+            e.g. a larger connection pool for concurrent uploads
+        profile_name (str, optional): AWS profile to authenticate with
+    
     Returns:
         boto3.client: Configured S3 client
     """
     # Get endpoint URL from environment variable (None for real AWS)
     endpoint_url = os.environ.get('S3_ENDPOINT_URL', None)
     
+    # Building a Session is expensive, so only do it when a profile is requested
+    session = boto3.session.Session(profile_name=profile_name) if profile_name else boto3
+    
     # Check if we are using a local emulator by checking the endpoint URL (typically 'http://localhost:5000')
     if endpoint_url and 'localhost' in endpoint_url:
         # Disable SSL verification when using a local emulator
-        s3_client = boto3.client('s3', endpoint_url=endpoint_url, verify=False)
+        s3_client = session.client('s3', endpoint_url=endpoint_url, verify=False, config=config)
     else:
         # Use SSL verification when connecting to AWS S3
-        s3_client = boto3.client('s3', endpoint_url=endpoint_url, verify=True)
+        s3_client = session.client('s3', endpoint_url=endpoint_url, verify=True, config=config)
     
     return s3_client
 
-def create_bucket(bucket_name, region=None):
+def create_bucket(bucket_name, region=None, client=None):
     """
     Create an S3 bucket.
     
     Args:
         bucket_name (str): Name of the bucket to create
         region (str, optional): AWS region for the bucket
+        client (boto3.client, optional): Existing S3 client to reuse
     
     Returns:
         bool: True if bucket created successfully, False otherwise
     """
-    s3_client = get_s3_client()
+    s3_client = client or get_s3_client()
     
     try:
         # Different approach needed depending on if we're using Moto or real AWS
@@ -68,32 +81,41 @@ def create_bucket(bucket_name, region=None):
         logger.error(f"Error creating bucket '{bucket_name}': {e}")
         return False
 
-def bucket_exists(bucket_name):
+def bucket_exists(bucket_name, client=None):
     """
     Check if a bucket exists.
     
     Args:
         bucket_name (str): Name of the bucket to check
+        client (boto3.client, optional): Existing S3 client to reuse
     
     Returns:
         bool: True if bucket exists, False otherwise
+    
+    Raises:
+        ClientError: For any error other than the bucket not being found
     """
-    s3_client = get_s3_client()
+    s3_client = client or get_s3_client()
     
     try:
         s3_client.head_bucket(Bucket=bucket_name)
         return True
-    except ClientError:
-        return False
+    except ClientError as e:
+        if e.response['Error']['Code'] == '404':
+            return False
+        raise
 
-def list_buckets():
+def list_buckets(client=None):
     """
     List all S3 buckets.
     
+    Args:
+        client (boto3.client, optional): Existing S3 client to reuse
+    
     Returns:
         list: List of bucket names
     """
-    s3_client = get_s3_client()
+    s3_client = client or get_s3_client()
     
     try:
         response = s3_client.list_buckets()
@@ -103,26 +125,32 @@ def list_buckets():
         logger.error(f"Error listing buckets: {e}")
         return []
 
-def upload_file(bucket_name, key, content):
+def upload_file(bucket_name, key, content, metadata=None, client=None):
     """
     Upload content to an S3 object.
     
     Args:
         bucket_name (str): Target bucket name
         key (str): Object key (path)
-        content (str or bytes): Content to upload
+        content (str, bytes or file-like): Content to upload; binary file
+            objects are streamed by boto3 rather than read into memory
+        metadata (dict, optional): Metadata to attach to the object
+        client (boto3.client, optional): Existing S3 client to reuse; boto3
+            clients are thread-safe, so one client can be shared by workers
     
     Returns:
         bool: True if upload successful, False otherwise
     """
-    s3_client = get_s3_client()
+    s3_client = client or get_s3_client()
     
     # Convert string to bytes if necessary
     if isinstance(content, str):
         content = content.encode('utf-8')
     
+    extra_args = {'Metadata': metadata} if metadata else {}
+    
     try:
-        s3_client.put_object(Bucket=bucket_name, Key=key, Body=content)
+        s3_client.put_object(Bucket=bucket_name, Key=key, Body=content, **extra_args)
         logger.info(f"File '{key}' uploaded to bucket '{bucket_name}'")
         return True
     
@@ -130,21 +158,27 @@ def upload_file(bucket_name, key, content):
         logger.error(f"Error uploading file '{key}' to bucket '{bucket_name}': {e}")
         return False
 
-def read_file(bucket_name, key):
+def read_file(bucket_name, key, client=None, stream=False):
     """
     Read content from an S3 object.
     
     Args:
         bucket_name (str): Source bucket name
         key (str): Object key (path)
+        client (boto3.client, optional): Existing S3 client to reuse
+        stream (bool, optional): If True, return the undecoded
+            StreamingBody instead of reading the whole object into memory
     
     Returns:
         str: Object content (UTF-8 decoded) or None if error
+        (botocore.response.StreamingBody when stream=True)
     """
-    s3_client = get_s3_client()
+    s3_client = client or get_s3_client()
     
     try:
         response = s3_client.get_object(Bucket=bucket_name, Key=key)
+        if stream:
+            return response['Body']
         content = response['Body'].read().decode('utf-8')
         return content
     
@@ -152,7 +186,7 @@ def read_file(bucket_name, key):
         logger.error(f"Error reading file '{key}' from bucket '{bucket_name}': {e}")
         raise Exception(f"File read error: {e}")
 
-def update_file(bucket_name, key, content):
+def update_file(bucket_name, key, content, client=None):
     """
     Update an S3 object (same as upload_file, S3 overwrites by default).
     
@@ -160,24 +194,26 @@ def update_file(bucket_name, key, content):
         bucket_name (str): Target bucket name
         key (str): Object key (path)
         content (str or bytes): New content
+        client (boto3.client, optional): Existing S3 client to reuse
     
     Returns:
         bool: True if update successful, False otherwise
     """
-    return upload_file(bucket_name, key, content)
+    return upload_file(bucket_name, key, content, client=client)
 
-def delete_file(bucket_name, key):
+def delete_file(bucket_name, key, client=None):
     """
     Delete an S3 object.
     
     Args:
         bucket_name (str): Bucket name
         key (str): Object key (path)
+        client (boto3.client, optional): Existing S3 client to reuse
     
     Returns:
         bool: True if deletion successful, False otherwise
     """
-    s3_client = get_s3_client()
+    s3_client = client or get_s3_client()
     
     try:
         s3_client.delete_object(Bucket=bucket_name, Key=key)
@@ -188,50 +224,102 @@ def delete_file(bucket_name, key):
         logger.error(f"Error deleting file '{key}' from bucket '{bucket_name}': {e}")
         return False
 
-def list_files(bucket_name, prefix=''):
+def list_files(bucket_name, prefix='', client=None):
     """
     List all files in a bucket, optionally filtered by prefix.
     
     Args:
         bucket_name (str): Bucket name
         prefix (str, optional): Key prefix to filter by
+        client (boto3.client, optional): Existing S3 client to reuse
     
     Returns:
         list: List of object keys
     """
-    s3_client = get_s3_client()
+    s3_client = client or get_s3_client()
     
     try:
-        response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-        
-        if 'Contents' in response:
-            return [obj['Key'] for obj in response['Contents']]
-        return []
+        paginator = s3_client.get_paginator('list_objects_v2')
+        return [
+            obj['Key']
+            for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+            for obj in page.get('Contents', [])
+        ]
     
     except ClientError as e:
         logger.error(f"Error listing objects in bucket '{bucket_name}': {e}")
         return []
 
-def delete_bucket(bucket_name, force=False):
+def list_files_prefetched(bucket_name, prefix='', client=None, page_size=1000):
+    """
+    Yield the keys in a bucket, fetching the next page in the background.
+    
+    While the caller consumes one page of keys, the request for the
+    following page is already in flight.
+    
+    Args:
+        bucket_name (str): Bucket name
+        prefix (str, optional): Key prefix to filter by
+        client (boto3.client, optional): Existing S3 client to reuse
+        page_size (int, optional): Maximum keys per listing request
+    
+    Yields:
+        str: Object key
+    
+    Raises:
+        ClientError: If a listing request fails
+    """
+    s3_client = client or get_s3_client()
+    
+    def fetch_page(token=None):
+        kwargs = {'Bucket': bucket_name, 'Prefix': prefix, 'MaxKeys': page_size}
+        if token:
+            kwargs['ContinuationToken'] = token
+        return s3_client.list_objects_v2(**kwargs)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(fetch_page)
+        while future is not None:
+            response = future.result()
+            token = response.get('NextContinuationToken') if response.get('IsTruncated') else None
+            future = executor.submit(fetch_page, token) if token else None
+            
+            for obj in response.get('Contents', []):
+                yield obj['Key']
+
+def delete_bucket(bucket_name, force=False, client=None):
     """
     Delete an S3 bucket. If force=True, delete all objects first.
     
     Args:
         bucket_name (str): Bucket to delete
         force (bool): If True, delete all objects in the bucket first
+        client (boto3.client, optional): Existing S3 client to reuse
     
     Returns:
         bool: True if deletion successful, False otherwise
     """
-    s3_client = get_s3_client()
+    s3_client = client or get_s3_client()
     
     try:
         if force:
-            # Delete all objects in the bucket first
-            objects = list_files(bucket_name)
-            if objects:
-                for key in objects:
-                    delete_file(bucket_name, key)
+            # Delete all objects in the bucket first, one request per page
+            # of up to 1000 keys
+            paginator = s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=bucket_name):
+                keys = [obj['Key'] for obj in page.get('Contents', [])]
+                if keys:
+                    response = s3_client.delete_objects(
+                        Bucket=bucket_name,
+                        Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
+                    )
+                    # Quiet mode only reports failures, and still returns HTTP 200
+                    errors = response.get('Errors', [])
+                    for error in errors:
+                        logger.error(f"Error deleting file '{error['Key']}' from bucket "
+                                     f"'{bucket_name}': {error['Code']} {error['Message']}")
+                    if errors:
+                        return False
         
         s3_client.delete_bucket(Bucket=bucket_name)
         logger.info(f"Bucket '{bucket_name}' deleted")
@@ -241,24 +329,52 @@ def delete_bucket(bucket_name, force=False):
         logger.error(f"Error deleting bucket '{bucket_name}': {e}")
         return False
 
-# Upload a large file with multipart support
-def upload_large_file(file_path, bucket_name, object_name, endpoint_url=None):
-    s3_client = get_s3_client(endpoint_url)
-    config = boto3.s3.transfer.TransferConfig(
-        multipart_threshold=5 * 1024 * 1024,  # 5MB
-        multipart_chunksize=5 * 1024 * 1024   # 5MB
+def upload_large_file(bucket_name, key, file_path, part_size=5 * 1024 * 1024,
+                      metadata=None, concurrency=10, client=None):
+    """
+    Upload a large file using multipart upload, sending parts in parallel.
+    
+    Delegates to boto3's managed transfer, which splits the file into parts
+    and uploads them from its own thread pool. Installing ``boto3[crt]``
+    lets boto3 switch to the AWS CRT transfer client for higher throughput.
+    
+    Args:
+        bucket_name (str): Target bucket name
+        key (str): Object key (path)
+        file_path (str): Path to the local file to upload
+        part_size (int, optional): Size of each part in bytes (S3 requires
+            at least 5MB for every part except the last)
+        metadata (dict, optional): Metadata to attach to the object
+        concurrency (int, optional): Number of parts uploaded in parallel
+        client (boto3.client, optional): Existing S3 client to reuse
+    
+    Returns:
+        bool: True if upload successful, False otherwise
+    """
+    s3_client = client or get_s3_client(
+        config=Config(max_pool_connections=concurrency * 2)
     )
-
+    config = TransferConfig(
+        multipart_threshold=part_size,
+        multipart_chunksize=part_size,
+        max_concurrency=concurrency,
+        use_threads=True
+    )
+    
     try:
         s3_client.upload_file(
             Filename=file_path,
             Bucket=bucket_name,
-            Key=object_name,
-            Config=config
+            Key=key,
+            Config=config,
+            ExtraArgs={'Metadata': metadata} if metadata else {}
         )
-        print(f"Upload successful: {object_name}")
-    except Exception as e:
-        print(f"Upload failed: {e}")
+        logger.info(f"Large file '{key}' uploaded to bucket '{bucket_name}'")
+        return True
+    
+    except (ClientError, S3UploadFailedError, OSError) as e:
+        logger.error(f"Error uploading large file '{key}' to bucket '{bucket_name}': {e}")
+        return False
 
 def load_config_from_file(config_file='config.json'):
     """
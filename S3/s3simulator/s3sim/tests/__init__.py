@@ -0,0 +1,5 @@
+"""
+Tests for the s3sim package.
+"""
+
+LARGE_FILE_SIZE = 15 * 1024 * 1024  # 15MB, shared by the multipart tests
@@ -0,0 +1,113 @@
+"""
+Tests for the asyncio S3 operations module.
+"""
+
+import asyncio
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from s3sim import async_operations
+from s3sim.s3_operations import create_bucket, read_file, upload_file
+
+@pytest.fixture
+def fallback_s3_mock(s3_mock, monkeypatch):
+    """Use the boto3 thread-pool fallback against the mock S3 service."""
+    monkeypatch.setattr(async_operations, 'aioboto3', None)
+
+@pytest.fixture
+def moto_server(aws_credentials, monkeypatch):
+    """Serve S3 over HTTP, which aiobotocore needs, from a Moto server thread."""
+    pytest.importorskip('aioboto3')
+    moto_server_module = pytest.importorskip('moto.server')
+    server = moto_server_module.ThreadedMotoServer(port=0, verbose=False)
+    server.start()
+    _, port = server.get_host_and_port()
+    monkeypatch.setenv('S3_ENDPOINT_URL', f'http://localhost:{port}')
+    yield
+    server.stop()
+
+async def collect(items):
+    """Gather an async iterator of (key, content) pairs into a dict."""
+    return {key: content async for key, content in items}
+
+class TestAsyncOperations:
+    """Test async S3 operations with moto."""
+    
+    def test_upload_files(self, fallback_s3_mock):
+        """Test concurrent uploads."""
+        create_bucket('test-bucket')
+        items = [('a.txt', 'Content A'), ('b.txt', 'Content B')]
+        
+        assert asyncio.run(async_operations.upload_files('test-bucket', items)) == [True, True]
+        assert read_file('test-bucket', 'a.txt') == 'Content A'
+        assert read_file('test-bucket', 'b.txt') == 'Content B'
+    
+    def test_read_all_files(self, fallback_s3_mock):
+        """Test listing a bucket and reading every object concurrently."""
+        create_bucket('test-bucket')
+        upload_file('test-bucket', 'dir/file1.txt', 'Content 1')
+        upload_file('test-bucket', 'dir/file2.txt', 'Content 2')
+        upload_file('test-bucket', 'other.txt', 'Other')
+        
+        contents = asyncio.run(collect(async_operations.read_all_files(
+            'test-bucket', prefix='dir/', max_concurrency=1)))
+        assert contents == {'dir/file1.txt': 'Content 1', 'dir/file2.txt': 'Content 2'}
+    
+    def test_read_all_files_missing_bucket(self, fallback_s3_mock):
+        """Test that listing a missing bucket raises instead of finding nothing."""
+        with pytest.raises(ClientError):
+            asyncio.run(collect(async_operations.read_all_files('missing-bucket')))
+    
+    def test_read_nonexistent_file(self, fallback_s3_mock):
+        """Test that a missing object fails the whole read."""
+        create_bucket('test-bucket')
+        
+        with pytest.raises(Exception):
+            asyncio.run(async_operations.read_files('test-bucket', ['missing.txt']))
+
+class TestAsyncOperationsAioboto3:
+    """Test async S3 operations through aioboto3 against a Moto server."""
+    
+    def test_upload_and_read_files(self, moto_server):
+        """Test concurrent uploads and reads."""
+        create_bucket('test-bucket')
+        items = [('a.txt', 'Content A'), ('b.txt', 'Content B')]
+        
+        assert asyncio.run(async_operations.upload_files('test-bucket', items)) == [True, True]
+        contents = asyncio.run(async_operations.read_files('test-bucket', ['a.txt', 'b.txt']))
+        assert contents == {'a.txt': 'Content A', 'b.txt': 'Content B'}
+    
+    def test_read_all_files(self, moto_server):
+        """Test paginated listing and bounded concurrent reads."""
+        create_bucket('test-bucket')
+        upload_file('test-bucket', 'dir/file1.txt', 'Content 1')
+        upload_file('test-bucket', 'dir/file2.txt', 'Content 2')
+        upload_file('test-bucket', 'other.txt', 'Other')
+        
+        contents = asyncio.run(collect(async_operations.read_all_files(
+            'test-bucket', prefix='dir/', max_concurrency=1)))
+        assert contents == {'dir/file1.txt': 'Content 1', 'dir/file2.txt': 'Content 2'}
+    
+    def test_read_all_files_missing_bucket(self, moto_server):
+        """Test that listing a missing bucket raises instead of finding nothing."""
+        with pytest.raises(ClientError):
+            asyncio.run(collect(async_operations.read_all_files('missing-bucket')))
+    
+    def test_read_nonexistent_file(self, moto_server):
+        """Test that a missing object fails the whole read."""
+        create_bucket('test-bucket')
+        
+        with pytest.raises(Exception):
+            asyncio.run(async_operations.read_files('test-bucket', ['missing.txt']))
+
+def test_upload_files_with_client(aws_credentials):
+    """Test that an explicit synchronous client is used even with aioboto3."""
+    with mock_aws():
+        s3_client = boto3.client('s3')
+        create_bucket('test-bucket', client=s3_client)
+        items = [('a.txt', 'Content A')]
+        
+        assert asyncio.run(async_operations.upload_files('test-bucket', items, client=s3_client)) == [True]
+        assert read_file('test-bucket', 'a.txt', client=s3_client) == 'Content A'
\ No newline at end of file
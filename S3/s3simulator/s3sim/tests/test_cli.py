@@ -0,0 +1,58 @@
+"""
+Tests for the S3Sim command line interface.
+"""
+
+import pytest
+
+from s3sim import cli, s3_operations
+
+class TestCLI:
+    """Test the CLI entry point with moto."""
+    
+    def test_main_reuses_parser(self, s3_mock, capsys, monkeypatch):
+        """Test calling main() repeatedly with explicit argument lists."""
+        def fail_build_parser():
+            raise AssertionError("main() should reuse the module-level parser")
+        monkeypatch.setattr(cli, '_build_parser', fail_build_parser)
+        
+        parse_calls = []
+        parse_args = cli._PARSER.parse_args
+        def counting_parse_args(argv=None):
+            parse_calls.append(argv)
+            return parse_args(argv)
+        monkeypatch.setattr(cli._PARSER, 'parse_args', counting_parse_args)
+        
+        cli.main(['--config', '', 'create-bucket', 'cli-bucket'])
+        cli.main(['--config', '', 'upload', 'cli-bucket', 'hello.txt', 'Hello, CLI!'])
+        
+        output = capsys.readouterr().out
+        assert "Bucket 'cli-bucket' created successfully" in output
+        assert "File 'hello.txt' uploaded to bucket 'cli-bucket' successfully" in output
+        assert len(parse_calls) == 2
+    
+    def test_read_output_is_byte_exact(self, s3_mock, capsysbinary):
+        """Test that redirected read output has no trailing newline added."""
+        cli.main(['--config', '', 'create-bucket', 'cli-bucket'])
+        cli.main(['--config', '', 'upload', 'cli-bucket', 'data.bin', 'no newline'])
+        capsysbinary.readouterr()
+        
+        cli.main(['--config', '', 'read', 'cli-bucket', 'data.bin'])
+        assert capsysbinary.readouterr().out == b'no newline'
+    
+    def test_main_without_command(self, capsys):
+        """Test that main() exits with usage when no command is given."""
+        with pytest.raises(SystemExit):
+            cli.main([])
+        assert 'usage:' in capsys.readouterr().out
+    
+    def test_upload_large_pool_size(self, s3_mock, monkeypatch):
+        """Test that the shared client's pool is sized from --concurrency."""
+        clients = []
+        def fake_upload_large_file(*args, client=None, **kwargs):
+            clients.append(client)
+            return True
+        monkeypatch.setattr(s3_operations, 'upload_large_file', fake_upload_large_file)
+        
+        cli.main(['--config', '', 'upload-large', 'cli-bucket', 'big.bin', 'big.bin',
+                  '--concurrency', '64'])
+        assert clients[0].meta.config.max_pool_connections == 128
\ No newline at end of file
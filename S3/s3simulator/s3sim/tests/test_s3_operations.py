@@ -3,31 +3,16 @@ Tests for S3 operations module.
 """
 
 import pytest
-from moto import mock_aws
 import os
 import boto3
 from botocore.exceptions import ClientError
 
 from s3sim.s3_operations import (
     create_bucket, bucket_exists, list_buckets, upload_file, 
-    read_file, update_file, delete_file, list_files, delete_bucket
+    read_file, update_file, delete_file, list_files, delete_bucket,
+    upload_large_file, list_files_prefetched
 )
 
-@pytest.fixture
-def aws_credentials():
-    """Mock AWS credentials for moto."""
-    os.environ['AWS_ACCESS_KEY_ID'] = 'testing'
-    os.environ['AWS_SECRET_ACCESS_KEY'] = 'testing'
-    os.environ['AWS_SECURITY_TOKEN'] = 'testing'
-    os.environ['AWS_SESSION_TOKEN'] = 'testing'
-    os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
-
-@pytest.fixture
-def s3_mock(aws_credentials):
-    """Create mock S3 service."""
-    with mock_aws():
-        yield
-
 class TestS3Operations:
     """Test S3 operations with moto."""
     
@@ -65,6 +50,24 @@ class TestS3Operations:
         # When reading binary file, it gets decoded to UTF-8
         assert read_file('test-bucket', 'binary.bin') == binary_content.decode('utf-8')
     
+    def test_upload_file_object(self, s3_mock, tmp_path):
+        """Test uploading from an open file object."""
+        create_bucket('test-bucket')
+        file_path = tmp_path / 'upload.txt'
+        file_path.write_bytes(b'File object content')
+        
+        with open(file_path, 'rb') as f:
+            assert upload_file('test-bucket', 'upload.txt', f)
+        assert read_file('test-bucket', 'upload.txt') == 'File object content'
+    
+    def test_read_file_stream(self, s3_mock):
+        """Test reading a file as a stream."""
+        create_bucket('test-bucket')
+        upload_file('test-bucket', 'stream.txt', 'Streamed content')
+        
+        body = read_file('test-bucket', 'stream.txt', stream=True)
+        assert b''.join(body.iter_chunks(chunk_size=4)) == b'Streamed content'
+    
     def test_read_nonexistent_file(self, s3_mock):
         """Test reading a file that doesn't exist."""
         create_bucket('test-bucket')
@@ -118,6 +121,15 @@ class TestS3Operations:
         assert len(subdir_files) == 1
         assert subdir_files[0] == 'subdir/file3.txt'
     
+    def test_list_files_prefetched(self, s3_mock):
+        """Test listing files across several pages."""
+        create_bucket('test-bucket')
+        keys = [f'file{i}.txt' for i in range(5)]
+        for key in keys:
+            upload_file('test-bucket', key, 'Content')
+        
+        assert list(list_files_prefetched('test-bucket', page_size=2)) == keys
+    
     def test_delete_bucket(self, s3_mock):
         """Test bucket deletion."""
         create_bucket('test-bucket')
@@ -132,4 +144,51 @@ class TestS3Operations:
         
         # Should delete bucket and its contents
         assert delete_bucket('test-bucket', force=True)
-        assert not bucket_exists('test-bucket')
\ No newline at end of file
+        assert not bucket_exists('test-bucket')
+    
+    def test_upload_large_file(self, s3_mock, tmp_path):
+        """Test multipart upload of a large file."""
+        create_bucket('test-bucket')
+        
+        # 11MB file -> three parts at the 5MB minimum part size
+        file_path = tmp_path / 'large.bin'
+        data = os.urandom(11 * 1024 * 1024)
+        file_path.write_bytes(data)
+        
+        assert upload_large_file('test-bucket', 'large.bin', str(file_path),
+                                 part_size=5 * 1024 * 1024, concurrency=2)
+        
+        s3_client = boto3.client('s3')
+        body = s3_client.get_object(Bucket='test-bucket', Key='large.bin')['Body'].read()
+        assert body == data
+    
+    def test_delete_bucket_force_many_objects(self, s3_mock, monkeypatch):
+        """Test force deletion of a bucket needing more than one delete batch."""
+        create_bucket('test-bucket')
+        s3_client = boto3.client('s3')
+        for i in range(1001):
+            s3_client.put_object(Bucket='test-bucket', Key=f'file{i}.txt', Body=b'')
+        
+        # Count the batched delete requests
+        calls = []
+        delete_objects = s3_client.delete_objects
+        def counting_delete_objects(**kwargs):
+            calls.append(len(kwargs['Delete']['Objects']))
+            return delete_objects(**kwargs)
+        monkeypatch.setattr(s3_client, 'delete_objects', counting_delete_objects)
+        
+        assert delete_bucket('test-bucket', force=True, client=s3_client)
+        assert calls == [1000, 1]
+        assert not bucket_exists('test-bucket', client=s3_client)
+    
+    def test_delete_bucket_force_reports_errors(self, s3_mock, monkeypatch):
+        """Test that per-key failures from delete_objects stop the deletion."""
+        create_bucket('test-bucket')
+        upload_file('test-bucket', 'file1.txt', 'Content')
+        s3_client = boto3.client('s3')
+        monkeypatch.setattr(s3_client, 'delete_objects', lambda **kwargs: {
+            'Errors': [{'Key': 'file1.txt', 'Code': 'AccessDenied', 'Message': 'Access Denied'}]
+        })
+        
+        assert not delete_bucket('test-bucket', force=True, client=s3_client)
+        assert bucket_exists('test-bucket', client=s3_client)
\ No newline at end of file
@@ -18,10 +18,14 @@ setup(
             'moto[server]>=4.0.0',
             'pytest>=7.0.0',
         ],
+        'async': [
+            'aioboto3>=11.0.0',
+        ],
     },
     entry_points={
         'console_scripts': [
             's3sim=s3sim.cli:main',
+            's3sim-async=s3sim.cli_async:main',
         ],
     },
     classifiers=[
@@ -6,16 +6,17 @@ Test script for s3sim with all the new features.
 import os
 import json
 import tempfile
-import shutil
-import subprocess
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pytest
+from botocore.config import Config
+from moto import mock_aws
+from s3sim.tests import LARGE_FILE_SIZE
 from s3sim.s3_operations import (
+    bucket_exists,
     create_bucket,
     delete_bucket,
-    list_buckets,
     upload_file,
     read_file,
-    delete_file,
     list_files,
     upload_large_file,
     get_object_metadata,
@@ -24,23 +25,8 @@ from s3sim.s3_operations import (
     permission_manager
 )
 
-def start_moto_server():
-    """Start moto server for testing."""
-    print("Starting Moto server...")
-    process = subprocess.Popen(
-        ["moto_server", "-p", "5000"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-    # Wait for server to start
-    time.sleep(2)
-    return process
-
-def stop_moto_server(process):
-    """Stop moto server."""
-    print("Stopping Moto server...")
-    process.terminate()
-    process.wait()
+# Run each test against Moto's in-memory S3 backend under pytest
+pytestmark = pytest.mark.usefixtures('s3_mock')
 
 def test_configuration_loading():
     """Test loading configuration from file."""
@@ -57,21 +43,20 @@ def test_configuration_loading():
     
     # Verify config loaded correctly
     assert "endpoint_url" in config
-    assert os.environ.get("S3_ENDPOINT_URL") == "http://localhost:5000"
+    assert config["endpoint_url"] == "http://localhost:5000"
     
     # Clean up
     os.unlink(config_path)
     print("✓ Configuration loading test passed")
 
-def test_bucket_operations(user_id="test_user"):
+def test_bucket_operations(user_id="test_user", client=None):
     """Test basic bucket operations."""
     # Create bucket
     bucket_name = "test-bucket"
-    assert create_bucket(bucket_name, user_id=user_id)
+    assert create_bucket(bucket_name, user_id=user_id, client=client)
     
-    # List buckets
-    buckets = list_buckets()
-    assert bucket_name in buckets
+    # Verify bucket exists
+    assert bucket_exists(bucket_name, client=client)
     
     # Verify permissions
     assert permission_manager.check_bucket_permission(bucket_name, user_id, "read")
@@ -79,109 +64,94 @@ def test_bucket_operations(user_id="test_user"):
     assert permission_manager.check_bucket_permission(bucket_name, user_id, "delete")
     
     # Delete bucket
-    assert delete_bucket(bucket_name, force=True, user_id=user_id)
+    assert delete_bucket(bucket_name, force=True, user_id=user_id, client=client)
     
     # Verify bucket deletion
-    buckets = list_buckets()
-    assert bucket_name not in buckets
+    assert not bucket_exists(bucket_name, client=client)
     
     print("✓ Bucket operations test passed")
 
-def test_file_operations_with_metadata(user_id="test_user"):
+def test_file_operations_with_metadata(user_id="test_user", client=None):
     """Test file operations with metadata."""
     # Create bucket
     bucket_name = "test-file-bucket"
-    assert create_bucket(bucket_name, user_id=user_id)
+    assert create_bucket(bucket_name, user_id=user_id, client=client)
     
     # Upload file with metadata
     key = "test-file.txt"
     content = "Hello, world!"
     metadata = {"author": "Test User", "version": "1.0"}
-    assert upload_file(bucket_name, key, content, user_id=user_id, metadata=metadata)
-    
-    # Read file
-    retrieved_content = read_file(bucket_name, key, user_id=user_id)
-    assert retrieved_content == content
+    assert upload_file(bucket_name, key, content, user_id=user_id, metadata=metadata, client=client)
+    
+    # Read file and list files concurrently (independent network calls)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(read_file, bucket_name, key, user_id=user_id, client=client): "read",
+            executor.submit(list_files, bucket_name, user_id=user_id, client=client): "list",
+        }
+        results = {futures[future]: future.result() for future in as_completed(futures)}
+    assert results["read"] == content
+    assert key in results["list"]
     
     # Verify metadata
     retrieved_metadata = get_object_metadata(bucket_name, key, user_id=user_id)
     assert "author" in retrieved_metadata
     assert retrieved_metadata["author"] == "Test User"
     
-    # List files
-    files = list_files(bucket_name, user_id=user_id)
-    assert key in files
-    
-    # Delete file
-    assert delete_file(bucket_name, key, user_id=user_id)
-    
-    # Clean up
-    delete_bucket(bucket_name, force=True)
+    # Clean up (force=True removes the file too)
+    delete_bucket(bucket_name, force=True, client=client)
     
     print("✓ File operations with metadata test passed")
 
-def test_multipart_upload(user_id="test_user"):
+def test_multipart_upload(large_file, user_id="test_user", client=None):
     """Test multipart upload for large files."""
     # Create bucket
     bucket_name = "test-multipart-bucket"
-    assert create_bucket(bucket_name, user_id=user_id)
+    assert create_bucket(bucket_name, user_id=user_id, client=client)
+    
+    # Upload using multipart
+    key = "large-file.bin"
+    metadata = {"content-type": "application/octet-stream"}
+    assert upload_large_file(
+        bucket_name, 
+        key, 
+        large_file, 
+        user_id=user_id,
+        part_size=1*1024*1024,  # 1MB parts
+        metadata=metadata,
+        client=client
+    )
     
-    # Create a temporary large file
-    temp_dir = tempfile.mkdtemp()
-    try:
-        large_file_path = os.path.join(temp_dir, "large_file.bin")
-        
-        # Create a 10MB file
-        with open(large_file_path, 'wb') as f:
-            f.write(b'0' * 10 * 1024 * 1024)  # 10MB of zeros
-        
-        # Upload using multipart
-        key = "large-file.bin"
-        metadata = {"content-type": "application/octet-stream"}
-        assert upload_large_file(
-            bucket_name, 
-            key, 
-            large_file_path, 
-            user_id=user_id,
-            part_size=1*1024*1024,  # 1MB parts
-            metadata=metadata
-        )
-        
-        # Verify file exists
-        files = list_files(bucket_name, user_id=user_id)
-        assert key in files
-        
-        # Check metadata
-        retrieved_metadata = get_object_metadata(bucket_name, key, user_id=user_id)
-        assert "content-type" in retrieved_metadata
-        
-        # Clean up
-        delete_file(bucket_name, key, user_id=user_id)
-        delete_bucket(bucket_name, force=True)
-        
-    finally:
-        # Clean up temp dir
-        shutil.rmtree(temp_dir)
+    # Verify file exists
+    files = list_files(bucket_name, user_id=user_id, client=client)
+    assert key in files
+    
+    # Check metadata
+    retrieved_metadata = get_object_metadata(bucket_name, key, user_id=user_id)
+    assert "content-type" in retrieved_metadata
+    
+    # Clean up (force=True removes the file too)
+    delete_bucket(bucket_name, force=True, client=client)
     
     print("✓ Multipart upload test passed")
 
-def test_permission_controls():
+def test_permission_controls(client=None):
     """Test permission controls."""
     # Create bucket with user1
     bucket_name = "permission-test-bucket"
     user1 = "user1"
     user2 = "user2"
     
-    assert create_bucket(bucket_name, user_id=user1)
+    assert create_bucket(bucket_name, user_id=user1, client=client)
     
     # Upload file as user1
     key = "secret.txt"
     content = "This is a secret"
-    assert upload_file(bucket_name, key, content, user_id=user1)
+    assert upload_file(bucket_name, key, content, user_id=user1, client=client)
     
     # Try to read as user2 (should fail)
     try:
-        read_file(bucket_name, key, user_id=user2)
+        read_file(bucket_name, key, user_id=user2, client=client)
         assert False, "User2 shouldn't be able to read user1's file"
     except Exception:
         pass  # Expected to fail
@@ -190,40 +160,48 @@ def test_permission_controls():
     permission_manager.add_object_permission(bucket_name, key, user2, "read")
     
     # Now user2 should be able to read
-    assert read_file(bucket_name, key, user_id=user2) == content
+    assert read_file(bucket_name, key, user_id=user2, client=client) == content
     
     # But user2 still can't write
     try:
-        upload_file(bucket_name, key, "Modified content", user_id=user2)
+        upload_file(bucket_name, key, "Modified content", user_id=user2, client=client)
         assert False, "User2 shouldn't be able to write to user1's file"
     except Exception:
         pass  # Expected to fail
     
     # Clean up
-    delete_bucket(bucket_name, force=True, user_id=user1)
+    delete_bucket(bucket_name, force=True, user_id=user1, client=client)
     
     print("✓ Permission controls test passed")
 
+@mock_aws
 def run_all_tests():
-    """Run all tests."""
-    moto_process = start_moto_server()
+    """Run all tests against Moto's in-memory S3 backend."""
+    print("\n=== Running S3Sim Tests ===\n")
     
-    try:
-        # Set endpoint URL for all tests
-        os.environ["S3_ENDPOINT_URL"] = "http://localhost:5000"
-        
-        print("\n=== Running S3Sim Tests ===\n")
-        
-        # Run tests
-        test_configuration_loading()
-        test_bucket_operations()
-        test_file_operations_with_metadata()
-        test_multipart_upload()
-        test_permission_controls()
+    # One client shared by every worker thread; clients are thread-safe
+    client = get_s3_client(config=Config(max_pool_connections=32))
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Outside pytest there is no large_file fixture, so allocate one
+        large_file = os.path.join(temp_dir, "large_file.bin")
+        with open(large_file, 'wb') as f:
+            f.truncate(LARGE_FILE_SIZE)
         
-        print("\n=== All Tests Passed! ===\n")
-    finally:
-        stop_moto_server(moto_process)
+        # Run tests concurrently; each one uses its own bucket
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(test_configuration_loading),
+                executor.submit(test_bucket_operations, client=client),
+                executor.submit(test_file_operations_with_metadata, client=client),
+                executor.submit(test_multipart_upload, large_file, client=client),
+                executor.submit(test_permission_controls, client=client),
+            ]
+            # Re-raise the first failure, if any
+            for future in futures:
+                future.result()
+    
+    print("\n=== All Tests Passed! ===\n")
 
 if __name__ == "__main__":
     run_all_tests()
\ No newline at end of file